@@ -5,9 +5,11 @@ WHITESPACE = "\n\t ,;"
 SINGLE_COMMENT = r"\/\/([^\n]*)\n"
 MULTILINE_COMMENT = r"\/\-.*?\-\/"
 
-STRING = r'"([^"]*)"'
+STRING = r'"([^"]*+)"'
 INT = r"-?([1-9]\d*|0)"
 FLOAT = r"-?\d+\.\d+"
 QINT = r"\@-?([1-9]\d*|0)"
 
-ID = r"@?[a-zA-Z][a-zA-Z0-9\-_]*"
+ID_TAIL = r"[a-zA-Z0-9_\-]*"
+ID = rf"@?[a-zA-Z]{ID_TAIL}"
+TRAIT_ID = rf"@?[A-Z]{ID_TAIL}"
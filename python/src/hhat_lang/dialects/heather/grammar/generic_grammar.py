@@ -13,6 +13,7 @@ from hhat_lang.dialects.heather.grammar import (
     QINT,
     SINGLE_COMMENT,
     STRING,
+    TRAIT_ID,
 )
 
 
@@ -37,7 +38,7 @@ def simple_id() -> Any:
 
 
 def trait_name_id() -> Any:
-    return _(r"@?[A-Z][a-zA-Z0-9\-_]*")
+    return _(TRAIT_ID)
 
 
 def trait_id() -> Any:
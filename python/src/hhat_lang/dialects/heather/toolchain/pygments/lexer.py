@@ -1,8 +1,14 @@
 from __future__ import annotations
 
-from pygments.lexer import RegexLexer, words
+import os
+import re
+from typing import Any, Callable, Generator, Iterator, TypeAlias
+
+from pygments.lexer import Lexer
+from pygments.regexopt import regex_opt
 from pygments.token import (
     Comment,
+    Error,
     Keyword,
     Literal,
     Name,
@@ -10,30 +16,107 @@ from pygments.token import (
     Operator,
     String,
     Whitespace,
+    _TokenType,
 )
 
 from hhat_lang.dialects.heather.grammar import (
     FLOAT,
     ID,
     INT,
-    MULTILINE_COMMENT,
     QINT,
     SINGLE_COMMENT,
     STRING,
+    TRAIT_ID,
     WHITESPACE,
 )
 
-__all__ = ["HhatLexer"]
+__all__ = ["HhatLexer", "find_first_lexer_by_filename"]
+
+# ``/- ... -/`` block comment as an unrolled loop: a single linear match that spans
+# newlines and, with possessive quantifiers, never backtracks, instead of a lazy
+# ``.*?`` retried per character
+_MULTILINE_COMMENT = r"/-[^-]*+-++(?:[^/-][^-]*+-++)*+/"
+
+# items of a ``#[...]`` trait list up to its closing ``]``; anything else ends the scan
+_TRAIT_LIST_RE = re.compile(
+    rf"(?P<name>{TRAIT_ID})"
+    rf"|(?P<ws>[{WHITESPACE}]++)"
+    rf"|(?P<single_comment>{SINGLE_COMMENT})"
+    rf"|(?P<multiline_comment>{_MULTILINE_COMMENT})"
+    r"|(?P<end>\])"
+    r"|(?P<other>.)"
+)
+_TRAIT_LIST_TOKENS = {
+    "name": Name.Decorator,
+    "ws": Whitespace,
+    "single_comment": Comment.Single,
+    "multiline_comment": Comment.Multiline,
+    "end": Operator.Punctuation,
+}
+
+# resolved once here, since ``_TokenType`` attribute chains are looked up on every access
+_IDENTIFIER = Name.Identifier
+
+# a lexer rule either names the token type of its match or yields the tokens itself,
+# optionally returning the position to resume from when it consumed past the match
+_Token: TypeAlias = tuple[int, _TokenType, str]
+_RuleAction: TypeAlias = (
+    _TokenType | Callable[["HhatLexer", re.Match], Generator[_Token, None, int | None]]
+)
+
+# single source for the H-hat file globs, shared by the lexer and its suffix index
+_FILENAME_GLOBS = ("*.hhat", "*.hat")
+
+
+def _classify_identifier(lexer: HhatLexer, match: re.Match) -> Generator[_Token, None, None]:
+    """Resolve an ``ID``-shaped match to a keyword, builtin type, boolean or identifier."""
+
+    value = match.group()
+    yield match.start(), lexer.keyword_map.get(value, _IDENTIFIER), value
+
+
+def _classify_symbol(lexer: HhatLexer, match: re.Match) -> Generator[_Token, None, None]:
+    """Resolve a symbol match to a keyword, operator or punctuation token."""
 
+    value = match.group()
+    yield match.start(), lexer.symbol_map[value], value
 
-class HhatLexer(RegexLexer):
+
+def _scan_trait_list(lexer: HhatLexer, match: re.Match) -> Generator[_Token, None, int]:
+    """
+    Lex a whole ``#[...]`` trait list in a single pass from its opening ``#[`` up to
+    the first ``]`` outside comments, returning the position right after it. On
+    anything that cannot be part of the list (e.g. a missing ``]``), it returns that
+    position instead so the main rules lex the rest as usual.
+    """
+
+    yield match.start(), Operator.Punctuation, "#["
+    pos = match.end()
+
+    for item in _TRAIT_LIST_RE.finditer(match.string, pos):
+        kind = item.lastgroup
+        assert kind is not None
+
+        if kind == "other":
+            return item.start()
+
+        yield item.start(), _TRAIT_LIST_TOKENS[kind], item.group()
+        pos = item.end()
+
+        if kind == "end":
+            break
+
+    return pos
+
+
+class HhatLexer(Lexer):
     """
     Pygments lexer for Heather dialect syntax.
     """
 
     name = "H-hat"
     aliases = ["hhat", "hhat-lang"]
-    filenames = ["*.hhat", "*.hat"]
+    filenames = _FILENAME_GLOBS
 
     keywords = (
         "main",
@@ -44,6 +127,8 @@ class HhatLexer(RegexLexer):
         "modifier",
         "metamod",
         "self",
+    )
+    keyword_symbols = (
         "::",
         "*",
         "&",
@@ -62,6 +147,8 @@ class HhatLexer(RegexLexer):
         "}",
         "[",
         "]",
+        "<",
+        ">",
     )
     builtin_types = (
         "int",
@@ -91,20 +178,110 @@ class HhatLexer(RegexLexer):
     )
     bool_literals = ("true", "false", "@true", "@false")
 
-    tokens = {
-        "root": [
-            (rf"{WHITESPACE}+", Whitespace),
-            (SINGLE_COMMENT, Comment.Single),
-            (MULTILINE_COMMENT, Comment.Multiline),
-            (words(keywords), Keyword.Namespace),
-            (words(builtin_types), Name.BuiltinType),
-            (words(operators), Operator),
-            (words(punctuation), Operator.Punctuation),
-            (ID, Name.Identifier),
-            (STRING, String),
-            (INT, Number.Integer),
-            (QINT, Number.QInteger),
-            (FLOAT, Number.Float),
-            (words(bool_literals, prefix=r"\b", suffix=r"\b"), Literal.Boolean),
-        ],
+    # every identifier-shaped word is matched once by ``ID`` and then classified here
+    keyword_map = {
+        **dict.fromkeys(keywords, Keyword.Namespace),
+        **dict.fromkeys(builtin_types, Name.BuiltinType),
+        **dict.fromkeys(bool_literals, Literal.Boolean),
     }
+    # likewise, all symbols are matched by one alternation and classified here
+    symbol_map = {
+        **dict.fromkeys(keyword_symbols, Keyword.Namespace),
+        **dict.fromkeys(operators, Operator),
+        **dict.fromkeys(punctuation, Operator.Punctuation),
+    }
+
+    # ordered ``(pattern, token type or callback)`` rules; the first one to match wins.
+    # They are compiled per class, so subclasses may override them
+    rules: list[tuple[str, _RuleAction]] = [
+        (rf"[{WHITESPACE}]+", Whitespace),
+        (SINGLE_COMMENT, Comment.Single),
+        (_MULTILINE_COMMENT, Comment.Multiline),
+        (r"#\[", _scan_trait_list),
+        (rf"#{TRAIT_ID}", Name.Decorator),
+        (ID, _classify_identifier),
+        (regex_opt(tuple(symbol_map)), _classify_symbol),
+        (STRING, String),
+        (FLOAT, Number.Float),
+        (INT, Number.Integer),
+        (QINT, Number.QInteger),
+    ]
+
+    _rules_re: re.Pattern[str]
+    _rule_actions: dict[str, _RuleAction]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._compile_rules()
+
+    @classmethod
+    def _compile_rules(cls) -> None:
+        """
+        Compile ``rules`` into a single regex, one named group per rule, so lexer
+        instances (e.g. one per ``get_lexer_by_name`` call) never recompile them.
+        """
+
+        cls._rules_re = re.compile(
+            "|".join(f"(?P<r{n}>{pattern})" for n, (pattern, _) in enumerate(cls.rules))
+        )
+        cls._rule_actions = {f"r{n}": action for n, (_, action) in enumerate(cls.rules)}
+
+    def get_tokens_unprocessed(self, text: str) -> Iterator[_Token]:
+        """
+        Tokenize ``text`` with a single regex made of all ``rules`` as named
+        alternatives: each token costs one match, dispatched on the alternative that
+        matched. Callbacks may return the position to resume from if they consumed
+        more than their match. Unmatched characters are emitted one by one as ``Error`` (or
+        ``Whitespace`` for newlines), as pygments' ``RegexLexer`` does.
+        """
+
+        match_at = self._rules_re.match
+        actions = self._rule_actions
+        pos, end = 0, len(text)
+
+        while pos < end:
+            match = match_at(text, pos)
+
+            if match is None:
+                yield pos, Whitespace if text[pos] == "\n" else Error, text[pos]
+                pos += 1
+                continue
+
+            assert match.lastgroup is not None
+            action = actions[match.lastgroup]
+
+            if isinstance(action, _TokenType):
+                yield pos, action, match.group()
+                pos = match.end()
+
+            else:
+                resume = yield from action(self, match)
+                pos = match.end() if resume is None else resume
+
+
+HhatLexer._compile_rules()
+
+# H-hat file extensions, resolved by a plain dict lookup before pygments' glob scan
+_SUFFIX_INDEX: dict[str, type[Lexer]] = {
+    glob.removeprefix("*"): HhatLexer for glob in _FILENAME_GLOBS
+}
+
+
+def find_first_lexer_by_filename(filename: str) -> type[Lexer] | None:
+    """
+    Get the lexer class for ``filename``, checking H-hat extensions first.
+
+    ``.hat`` and ``.hhat`` files resolve to ``HhatLexer`` straight from the suffix
+    index; anything else falls back to pygments' ``find_lexer_class_for_filename``,
+    which matches the filename against every registered lexer glob. Returns ``None``
+    if no lexer is found.
+    """
+
+    lexer_cls = _SUFFIX_INDEX.get(os.path.splitext(filename)[1].lower())
+    if lexer_cls is not None:
+        return lexer_cls
+
+    # imported here so that loading this module does not pull in pygments' lexer registry
+    from pygments.lexers import find_lexer_class_for_filename
+
+    return find_lexer_class_for_filename(filename)
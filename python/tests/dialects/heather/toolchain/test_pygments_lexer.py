@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+from typing import Callable
+
+import pytest
+from pygments.lexers.python import PythonLexer
+from pygments.token import (
+    Comment,
+    Error,
+    Keyword,
+    Literal,
+    Name,
+    Number,
+    Operator,
+    Whitespace,
+    _TokenType,
+)
+
+from hhat_lang.dialects.heather.toolchain.pygments.lexer import (
+    HhatLexer,
+    find_first_lexer_by_filename,
+)
+
+from ..code_samples import (
+    io1_types_def,
+    math1_types_def,
+    math2_types_def,
+    math3_types_def,
+    math4_types_def,
+    math5_types_def,
+    math_abs_def,
+    math_floor_def,
+    math_mod2pi_def,
+    math_modpi_def,
+    math_sin_def,
+    qstd1_types_def,
+)
+
+CODE_SAMPLES = (
+    math_floor_def,
+    math_mod2pi_def,
+    math_modpi_def,
+    math_abs_def,
+    math_sin_def,
+    math1_types_def,
+    math2_types_def,
+    math3_types_def,
+    math4_types_def,
+    math5_types_def,
+    io1_types_def,
+    qstd1_types_def,
+)
+
+
+def _lex(code: str) -> list[tuple[int, _TokenType, str]]:
+    return list(HhatLexer().get_tokens_unprocessed(code))
+
+
+@pytest.mark.parametrize(
+    "word,token",
+    [
+        ("fn", Keyword.Namespace),
+        ("type", Keyword.Namespace),
+        ("u32", Name.BuiltinType),
+        ("@bell_t", Name.BuiltinType),
+        ("true", Literal.Boolean),
+        ("@true", Literal.Boolean),
+        ("type_import", Name.Identifier),
+        ("mainly", Name.Identifier),
+    ],
+)
+def test_lexer_classifies_words(word: str, token: _TokenType) -> None:
+    assert _lex(word) == [(0, token, word)]
+
+
+@pytest.mark.parametrize("comment", ["/- multi\nline\n-/", "/- a - b -- c -/", "/--/"])
+def test_lexer_block_comment(comment: str) -> None:
+    assert _lex(f"{comment}x") == [
+        (0, Comment.Multiline, comment),
+        (len(comment), Name.Identifier, "x"),
+    ]
+
+
+def test_lexer_unterminated_block_comment() -> None:
+    tokens = _lex("/- never closed")
+
+    assert tokens[:2] == [(0, Error, "/"), (1, Error, "-")]
+    assert all(token is not Comment.Multiline for _, token, _ in tokens)
+
+
+def test_lexer_whitespace() -> None:
+    assert _lex("a, b;\tc") == [
+        (0, Name.Identifier, "a"),
+        (1, Whitespace, ", "),
+        (3, Name.Identifier, "b"),
+        (4, Whitespace, ";\t"),
+        (6, Name.Identifier, "c"),
+    ]
+
+
+@pytest.mark.parametrize("filename", ["main.hat", "src/hat_types/math.hhat", "MAIN.HHAT"])
+def test_find_lexer_hhat_files(filename: str) -> None:
+    assert find_first_lexer_by_filename(filename) is HhatLexer
+
+
+def test_find_lexer_fallback() -> None:
+    assert find_first_lexer_by_filename("script.py") is PythonLexer
+
+
+def test_lexer_classifies_symbols() -> None:
+    assert _lex("::&...:(") == [
+        (0, Keyword.Namespace, "::"),
+        (2, Keyword.Namespace, "&"),
+        (3, Operator, "..."),
+        (6, Operator, ":"),
+        (7, Operator.Punctuation, "("),
+    ]
+
+
+@pytest.mark.parametrize("sample", CODE_SAMPLES, ids=lambda fn: fn.__name__)
+def test_lexer_code_samples(sample: Callable[[], str]) -> None:
+    code = sample()
+    tokens = _lex(code)
+
+    assert "".join(value for _, _, value in tokens) == code
+    assert [(pos, value) for pos, token, value in tokens if token is Error] == []
+
+
+def test_lexer_modifier() -> None:
+    assert _lex("b<&>") == [
+        (0, Name.Identifier, "b"),
+        (1, Operator.Punctuation, "<"),
+        (2, Keyword.Namespace, "&"),
+        (3, Operator.Punctuation, ">"),
+    ]
+
+
+@pytest.mark.parametrize(
+    "code,names",
+    [
+        ("#[Printable Integers]", ["Printable", "Integers"]),
+        ("#[@Bell-t,Show]", ["@Bell-t", "Show"]),
+        ("#[Foo // c\n Bar]", ["Foo", "Bar"]),
+        ("#[Foo /- see ] -/ Bar]", ["Foo", "Bar"]),
+    ],
+)
+def test_lexer_trait_list(code: str, names: list[str]) -> None:
+    tokens = _lex(code)
+
+    assert "".join(value for _, _, value in tokens) == code
+    assert [value for _, token, value in tokens if token is Name.Decorator] == names
+    assert tokens[0] == (0, Operator.Punctuation, "#[")
+    assert tokens[-1] == (len(code) - 1, Operator.Punctuation, "]")
+    assert not any(token is Error for _, token, _ in tokens)
+
+
+def test_lexer_single_trait() -> None:
+    assert _lex("#Show") == [(0, Name.Decorator, "#Show")]
+
+
+def test_lexer_unterminated_trait_list() -> None:
+    tokens = _lex("#[Foo\nfn main() {}")
+
+    assert tokens[:3] == [
+        (0, Operator.Punctuation, "#["),
+        (2, Name.Decorator, "Foo"),
+        (5, Whitespace, "\n"),
+    ]
+    assert (6, Keyword.Namespace, "fn") in tokens
+    assert (9, Keyword.Namespace, "main") in tokens
+    assert not any(token is Error for _, token, _ in tokens)
+
+
+def test_lexer_subclass_rules() -> None:
+    class TagLexer(HhatLexer):
+        rules = [(r"%", Name.Tag), *HhatLexer.rules]
+
+    assert list(TagLexer().get_tokens_unprocessed("%x")) == [
+        (0, Name.Tag, "%"),
+        (1, Name.Identifier, "x"),
+    ]
+    assert _lex("%") == [(0, Error, "%")]
+
+
+def test_lexer_numbers() -> None:
+    assert _lex("3.14 -2 @3") == [
+        (0, Number.Float, "3.14"),
+        (4, Whitespace, " "),
+        (5, Number.Integer, "-2"),
+        (7, Whitespace, " "),
+        (8, Number.QInteger, "@3"),
+    ]